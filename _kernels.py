@@ -0,0 +1,29 @@
+"""
+Optional Numba-compiled kernels for the schedule generator.
+
+The pairwise overlap test is the innermost numeric loop of conflict-mask
+construction and conflict checks. When numba is installed the explicit
+loop below compiles to machine code; otherwise a NumPy broadcast stands
+in with identical results, so numba stays an optional extra rather than
+a hard dependency.
+"""
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def any_overlap(days_a, starts_a, ends_a, days_b, starts_b, ends_b):
+        for i in range(days_a.shape[0]):
+            for j in range(days_b.shape[0]):
+                if (days_a[i] == days_b[j]
+                        and ends_a[i] > starts_b[j]
+                        and ends_b[j] > starts_a[i]):
+                    return True
+        return False
+else:
+    def any_overlap(days_a, starts_a, ends_a, days_b, starts_b, ends_b):
+        return bool(((days_a[:, None] == days_b)
+                     & (ends_a[:, None] > starts_b)
+                     & (ends_b > starts_a[:, None])).any())
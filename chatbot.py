@@ -1,15 +1,24 @@
 import sys
 import os
+import csv
 import asyncio
 import streamlit as st
 import pandas as pd
+import numpy as np
 import nest_asyncio
-from pydantic import BaseModel, ValidationError
-from scraper import CUDScraper, check_timing_changes
-import itertools
+from dataclasses import dataclass, asdict
+from scraper import CUDScraper, check_timing_changes, run_sync
+from _kernels import any_overlap
 import re
-import matplotlib.pyplot as plt
+import math
+import zlib
+import functools
+from matplotlib import colormaps
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 import datetime
+import pathlib
 import subprocess
 
 
@@ -17,8 +26,17 @@ import subprocess
 def install_playwright_browser():
     """
     Installs the Playwright Chromium browser if not already installed.
-    The @st.cache_resource decorator ensures this is only run once.
+    The @st.cache_resource decorator ensures this is only run once per
+    process; the binary check below also skips the installer subprocess
+    entirely on restarts of a container that already has the browser.
     """
+    cache_dir = pathlib.Path(os.environ.get('PLAYWRIGHT_BROWSERS_PATH',
+                                            pathlib.Path.home() / '.cache' / 'ms-playwright'))
+    for pattern in ('chromium-*/chrome-linux/chrome',
+                    'chromium-*/chrome-win/chrome.exe',
+                    'chromium-*/chrome-mac/Chromium.app'):
+        if any(cache_dir.glob(pattern)):
+            return
     # We run the command with subprocess.
     # We only need chromium for this app.
     subprocess.run(["playwright", "install", "chromium"], check=True)
@@ -38,7 +56,24 @@ def show_app_title():
 # Data models
 tuple5 = tuple[str, str, str, float, float]
 
-class Session(BaseModel):
+# Weekly occupancy bitmask layout: 48 half-hour slots per day, one day per
+# 48-bit block. Unknown day codes share a spare block so they still collide.
+DAY_SLOT = {'M': 0, 'T': 1, 'W': 2, 'R': 3, 'F': 4, 'S': 5, 'U': 6}
+
+def build_time_mask(timeslots: list[tuple5]) -> int:
+    mask = 0
+    for day, _, _, s, e in timeslots:
+        block = DAY_SLOT.get(day, 7) * 48
+        lo = min(max(int(s * 2), 0), 47)
+        hi = min(max(math.ceil(e * 2), lo + 1), 48)
+        mask |= ((1 << (hi - lo)) - 1) << (block + lo)
+    return mask
+
+# All fields arrive from the CSV as strings, so there is nothing to
+# validate or coerce; a slotted frozen dataclass keeps per-row construction
+# cheap and the instances __dict__-free.
+@dataclass(slots=True, frozen=True)
+class Session:
     full_code: str
     course_name: str
     credits: str
@@ -55,78 +90,329 @@ class Section:
         self.course_code = course_code
         self.section_id = section_id
         self.timeslots = timeslots
+        # SoA copies of the timeslots so conflict tests are a few array
+        # compares instead of a Python double loop with tuple unpacking.
+        self._days = np.fromiter((ord(t[0]) for t in timeslots),
+                                 dtype=np.int8, count=len(timeslots))
+        self._starts = np.array([t[3] for t in timeslots], dtype=np.float32)
+        self._ends = np.array([t[4] for t in timeslots], dtype=np.float32)
+        # Half-hour occupancy bitset; start rounded down and end rounded up,
+        # so a zero AND between two masks proves the sections are disjoint.
+        self.mask = build_time_mask(timeslots)
+        # Day-usage bits plus per-day start/end boundary masks at minute
+        # granularity, for incremental days-used and back-to-back scoring.
+        # day_bits gets one bit per distinct day character — unknown codes
+        # (the CSV ships placeholder rows with Days = "N\A") each take their
+        # own bit rather than collapsing into the spare slot, so popcounts
+        # agree with count_days_used, which counts distinct characters.
+        self.day_bits = 0
+        bounds: dict[int, list[int]] = {}
+        for day, _, _, s, e in timeslots:
+            self.day_bits |= 1 << (DAY_SLOT[day] if day in DAY_SLOT else 8 + ord(day))
+            if e <= s:
+                # Zero-length placeholder slots (12:00:00 AM both ends)
+                # have no real adjacency; keeping them would set the same
+                # bit in both masks and count the boundary against itself.
+                continue
+            slot = DAY_SLOT.get(day, 7)
+            b = bounds.setdefault(slot, [0, 0])
+            b[0] |= 1 << min(max(round(s * 60), 0), 1441)
+            b[1] |= 1 << min(max(round(e * 60), 0), 1441)
+        self.b2b_bounds = [(d, b[0], b[1]) for d, b in bounds.items()]
     def conflicts_with(self, other: 'Section') -> bool:
-        for d1, *_ , s1, e1 in self.timeslots:
-            for d2, *_ , s2, e2 in other.timeslots:
-                if d1 == d2 and e1 > s2 and e2 > s1:
-                    return True
-        return False
+        if not (self.mask & other.mask):
+            return False
+        return any_overlap(self._days, self._starts, self._ends,
+                           other._days, other._starts, other._ends)
+
+def build_conflict_masks(sections: list[Section]) -> list[int]:
+    """
+    Bit j is set in masks[i] iff sections i and j conflict, so a conflict
+    test later is a single AND. Instead of N^2 conflicts_with calls, all
+    sections' timeslot arrays are concatenated and compared in one
+    broadcast; conflicting timeslot pairs are then mapped back to their
+    owning sections.
+    """
+    masks = [0] * len(sections)
+    if not sections:
+        return masks
+    days = np.concatenate([sec._days for sec in sections])
+    starts = np.concatenate([sec._starts for sec in sections])
+    ends = np.concatenate([sec._ends for sec in sections])
+    owner = np.repeat(np.arange(len(sections)),
+                      [len(sec._days) for sec in sections])
+    overlap = ((days[:, None] == days)
+               & (ends[:, None] > starts)
+               & (ends > starts[:, None]))
+    for i, j in zip(*(owner[idx].tolist() for idx in overlap.nonzero())):
+        if i != j:
+            masks[i] |= 1 << j
+    return masks
+
+def iter_schedules(courses: dict[str, list[Section]]):
+    """Lazily yields every conflict-free schedule, one course per level."""
+    # Branch on the most constrained courses first: conflicts near the root
+    # of the search tree prune whole subtrees of the larger-domain courses.
+    course_lists = sorted((courses[code] for code in courses), key=len)
+    if not course_lists or any(not lst for lst in course_lists):
+        return
+    sections = [sec for lst in course_lists for sec in lst]
+    masks = build_conflict_masks(sections)
+    # Per course, pair each section with its flat-id bit and conflict mask.
+    indexed = []
+    offset = 0
+    for lst in course_lists:
+        indexed.append([(1 << (offset + k), masks[offset + k], sec)
+                        for k, sec in enumerate(lst)])
+        offset += len(lst)
+    partial = []
+    # forbidden is the union of the chosen sections' conflict masks, so a
+    # candidate is admissible iff its own id bit is clear in it.
+    def backtrack(depth: int, forbidden: int):
+        if depth == len(indexed):
+            yield partial.copy()
+            return
+        for bit, conflict_mask, sec in indexed[depth]:
+            if bit & forbidden:
+                continue
+            partial.append(sec)
+            yield from backtrack(depth + 1, forbidden | conflict_mask)
+            partial.pop()
+    yield from backtrack(0, 0)
 
 def generate_schedules(courses: dict[str, list[Section]]) -> list[list[Section]]:
-    combos = itertools.product(*(courses[code] for code in courses))
-    return [list(c) for c in combos
-            if all(not s1.conflicts_with(s2)
-                   for s1, s2 in itertools.combinations(c, 2))]
+    return list(iter_schedules(courses))
 
-def parse_time(t: str) -> float:
-    try:
-        dt = pd.to_datetime(t).time()
-        return dt.hour + dt.minute/60.0
-    except:
+def _b2b_count(starts: int, ends: int) -> int:
+    # A start minute preceded by an end at the same or previous minute is a
+    # gap under 1.5 minutes — the same rule count_back_to_back applies.
+    return (starts & (ends | (ends << 1))).bit_count()
+
+def find_best_schedules(courses: dict[str, list[Section]], no_before: bool,
+                        no_after: bool, avoid_friday: bool,
+                        avoid_back_to_back: bool, minimize_days: bool,
+                        before_cutoff: float, after_cutoff: float) -> tuple[list[list[Section]], int]:
+    """
+    Branch-and-bound search for the minimum-score schedules. The score is
+    maintained incrementally during the DFS — every component is a
+    non-negative count that can only grow as sections are added, so a
+    partial score already above the best seen prunes the whole branch.
+    Returns the tied-for-best schedules and their score.
+    """
+    course_lists = sorted((courses[code] for code in courses), key=len)
+    if not course_lists or any(not lst for lst in course_lists):
+        return [], 0
+    sections = [sec for lst in course_lists for sec in lst]
+    masks = build_conflict_masks(sections)
+    indexed = []
+    offset = 0
+    for lst in course_lists:
+        course = []
+        for k, sec in enumerate(lst):
+            # Counted from the float64 tuple values, not the float32 SoA
+            # arrays, so a cutoff that exactly equals a class start resolves
+            # the same way here as in score_schedule.
+            static = 0
+            if no_before:
+                static += sum(1 for *_, s, _ in sec.timeslots if s < before_cutoff)
+            if no_after:
+                static += sum(1 for *_, s, _ in sec.timeslots if s > after_cutoff)
+            if avoid_friday:
+                static += sum(1 for d, *_ in sec.timeslots if d == 'F')
+            course.append((1 << (offset + k), masks[offset + k], sec, static))
+        indexed.append(course)
+        offset += len(lst)
+    best: list[list[Section]] = []
+    best_score = math.inf
+    partial: list[Section] = []
+    bound_starts = [0] * 8
+    bound_ends = [0] * 8
+    def backtrack(depth: int, forbidden: int, score: int, days_used: int):
+        nonlocal best, best_score
+        if depth == len(indexed):
+            if score < best_score:
+                best_score, best = score, [partial.copy()]
+            else:
+                best.append(partial.copy())
+            return
+        for bit, conflict_mask, sec, static in indexed[depth]:
+            if bit & forbidden:
+                continue
+            new_score = score + static
+            new_days = days_used
+            if minimize_days:
+                new_days = days_used | sec.day_bits
+                new_score += new_days.bit_count() - days_used.bit_count()
+            saved = []
+            if avoid_back_to_back:
+                for day, smask, emask in sec.b2b_bounds:
+                    olds, olde = bound_starts[day], bound_ends[day]
+                    saved.append((day, olds, olde))
+                    news, newe = olds | smask, olde | emask
+                    new_score += _b2b_count(news, newe) - _b2b_count(olds, olde)
+                    bound_starts[day], bound_ends[day] = news, newe
+            if new_score <= best_score:
+                partial.append(sec)
+                backtrack(depth + 1, forbidden | conflict_mask, new_score, new_days)
+                partial.pop()
+            for day, olds, olde in saved:
+                bound_starts[day], bound_ends[day] = olds, olde
+    backtrack(0, 0, 0, 0)
+    return best, 0 if not best else int(best_score)
+
+# parse_time is called once per (session, day) pair but there are only a few
+# dozen distinct time strings per term, so memoize per string.
+_parse_time_cache: dict[str, float] = {}
+
+def _parse_time_uncached(t: str) -> float:
+    # Portal times look like "2:59:00 PM"; parse the digits directly and
+    # validate explicitly instead of routing a Timestamp construction
+    # through a catch-all except. Unparseable input still maps to 0.0.
+    if not t or ':' not in t:
+        return 0.0
+    text = t.strip().upper()
+    meridiem = ''
+    if text.endswith(('AM', 'PM')):
+        meridiem = text[-2:]
+        text = text[:-2].strip()
+    h, _, rest = text.partition(':')
+    m = rest.split(':', 1)[0]
+    if not (h.isdigit() and m.isdigit()):
+        return 0.0
+    hour, minute = int(h), int(m)
+    if meridiem == 'PM' and hour != 12:
+        hour += 12
+    elif meridiem == 'AM' and hour == 12:
+        hour = 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
         return 0.0
+    return hour + minute / 60.0
 
+def parse_time(t: str) -> float:
+    cached = _parse_time_cache.get(t)
+    if cached is None:
+        _parse_time_cache[t] = cached = _parse_time_uncached(t)
+    return cached
+
+_BASE_CODE_RE = re.compile(r"^([A-Za-z]+\d+)")
+
+@functools.lru_cache(maxsize=4096)
 def get_base_code(full_code: str) -> str:
-    m = re.match(r"^([A-Za-z]+\d+)", full_code)
+    m = _BASE_CODE_RE.match(full_code)
     return m.group(1) if m else full_code
 
 def load_sessions(filename: str) -> list[Session]:
     if not os.path.exists(filename):
         return []
-    df = pd.read_csv(filename, dtype=str)
-    df.fillna("", inplace=True)
     colmap = {"Course":"full_code","Course Name":"course_name","Credits":"credits",
               "Instructor":"instructor","Room":"room","Days":"days",
               "Start Time":"start_time","End Time":"end_time",
               "Max Enrollment":"max_enrollment","Total Enrollment":"total_enrollment"}
-    df.rename(columns=colmap, inplace=True)
-    if "full_code" in df.columns:
-        df["full_code"] = df["full_code"].replace("", pd.NA).ffill()
-    else:
-        st.error("CSV missing 'Course' column.")
-        return []
     sessions = []
-    for row in df.to_dict(orient="records"):
-        try:
-            sessions.append(Session(**row))
-        except ValidationError as e:
-            st.warning(f"Invalid session data: {e}")
+    last_code = ""
+    with open(filename, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        header = set(reader.fieldnames or [])
+        if "Course" not in header:
+            st.error("CSV missing 'Course' column.")
+            return []
+        missing = [src for src in colmap if src not in header]
+        if missing:
+            st.warning(f"CSV missing columns: {', '.join(missing)}")
+            return []
+        # The course code is forward-filled from the last non-blank row.
+        for row in reader:
+            data = {dst: row.get(src) or "" for src, dst in colmap.items()}
+            if data["full_code"]:
+                last_code = data["full_code"]
+            elif last_code:
+                data["full_code"] = last_code
+            else:
+                continue
+            sessions.append(Session(**data))
     return sessions
 
+@st.cache_data(show_spinner=False)
+def load_dashboard_data(filename: str, mtime: float) -> tuple[list[Session], pd.DataFrame]:
+    # mtime is part of the cache key, so a fresh scrape (which rewrites the
+    # CSV) invalidates the entry while ordinary widget reruns hit the cache.
+    # The DataFrame and its base_code column are built here too: serializing
+    # every Session and rebuilding the frame on each rerun was the main
+    # interaction latency on the dashboard.
+    sessions = load_sessions(filename)
+    df = pd.DataFrame([asdict(s) for s in sessions])
+    if not df.empty:
+        df['base_code'] = df['full_code'].str.extract(_BASE_CODE_RE, expand=False).fillna(df['full_code'])
+        # Times and day codes decoded once per CSV here; Generate reads the
+        # precomputed columns.
+        df['_s'] = df['start_time'].map(parse_time)
+        df['_e'] = df['end_time'].map(parse_time)
+        df['_days'] = [tuple(d.replace(',', '')) for d in df['days']]
+    return sessions, df
+
+def build_sections(df: pd.DataFrame, codes: list[str]) -> dict[str, list[Section]]:
+    """
+    Assembles the per-course Section lists for the picked base codes in one
+    pass: filter with isin, group by (base_code, full_code), and read each
+    group's columns as arrays instead of iterating rows.
+    """
+    cds: dict[str, list[Section]] = {c: [] for c in codes}
+    picked = df[df['base_code'].isin(codes)]
+    for (base, full), grp in picked.groupby(['base_code', 'full_code'], sort=False):
+        tsl = []
+        for day_codes, st_, et, s, e in zip(grp['_days'].to_numpy(),
+                                            grp['start_time'].to_numpy(),
+                                            grp['end_time'].to_numpy(),
+                                            grp['_s'].to_numpy(),
+                                            grp['_e'].to_numpy()):
+            if not day_codes:
+                continue
+            tsl.extend((d, st_, et, s, e) for d in day_codes)
+        if tsl:
+            cds[base].append(Section(base, full, tsl))
+    return cds
+
 def run_scraper(user: str, pwd: str, sem: str, fname: str) -> None:
     if os.path.exists(fname): os.remove(fname)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     scraper = CUDScraper(user, pwd, sem, csv_filename=fname)
-    loop.run_until_complete(scraper.run(headless=True))
+    # Same persistent loop as verify_credentials, so the Chromium launched
+    # for the login check is still warm here.
+    run_sync(scraper.run(headless=True))
+
+# Plot constants hoisted out of plot_schedule, which is rebuilt on every
+# Prev/Next click. Colors hash the course code (crc32, so the mapping is
+# stable across processes) into the tab20 cycle.
+_DAYS = ('M','T','W','R','F')
+_DAY_IDX = {d:i for i,d in enumerate(_DAYS)}
+_TAB20 = colormaps['tab20']
+
+def _course_color(code: str):
+    return _TAB20(zlib.crc32(code.encode()) % _TAB20.N)
 
 def plot_schedule(sections: list[Section]):
-    days = ['M','T','W','R','F']
-    day_idx = {d:i for i,d in enumerate(days)}
     min_t = min(s for sec in sections for *_,s,_ in sec.timeslots) if any(sec.timeslots for sec in sections) else 8
     max_t = max(e for sec in sections for *_,_,e in sec.timeslots) if any(sec.timeslots for sec in sections) else 18
-    fig, ax = plt.subplots(figsize=(10,6))
-    cmap = plt.get_cmap('tab20')
-    colors = {code:cmap(i%cmap.N) for i,code in enumerate({sec.course_code for sec in sections})}
+    # A Figure built directly never enters pyplot's global registry, so
+    # nothing accumulates across reruns and no implicit state is shared.
+    fig = Figure(figsize=(10,6))
+    ax = fig.add_subplot()
+    # One collection for all rectangles instead of per-patch bookkeeping.
+    rects, facecolors, labels = [], [], []
     for sec in sections:
+        color = _course_color(sec.course_code)
         for d,_,_,s,e in sec.timeslots:
-            ax.add_patch(plt.Rectangle((day_idx[d],s),1,e-s,facecolor=colors[sec.course_code],edgecolor='black',alpha=0.8))
-            ax.text(day_idx[d]+0.5,s+(e-s)/2,sec.course_code,ha='center',va='center',color='white')
-    ax.set_xlim(0,len(days)); ax.set_ylim(max_t,min_t)
-    ax.set_xticks([i+0.5 for i in range(len(days))]); ax.set_xticklabels(days)
+            rects.append(Rectangle((_DAY_IDX[d],s),1,e-s))
+            facecolors.append(color)
+            labels.append((_DAY_IDX[d]+0.5, s+(e-s)/2, sec.course_code))
+    ax.add_collection(PatchCollection(rects, facecolors=facecolors, edgecolors='black', alpha=0.8))
+    for x, y, txt in labels:
+        ax.text(x, y, txt, ha='center', va='center', color='white')
+    ax.set_xlim(0,len(_DAYS)); ax.set_ylim(max_t,min_t)
+    ax.set_xticks([i+0.5 for i in range(len(_DAYS))]); ax.set_xticklabels(_DAYS)
     yticks=[]; t=int(min_t*2)/2
     while t<=max_t: yticks.append(t); t+=0.5
     ax.set_yticks(yticks); ax.set_yticklabels([f"{int(v):02d}:{int((v-int(v))*60):02d}" for v in yticks])
-    ax.set_xlabel('Day'); ax.set_ylabel('Time'); plt.tight_layout()
+    ax.set_xlabel('Day'); ax.set_ylabel('Time'); fig.tight_layout()
     return fig
 
 def count_morning_classes(schedule, cutoff: float) -> int:
@@ -151,37 +437,23 @@ def count_back_to_back(schedule) -> int:
     - Case 2: End at 10:59, Start at 11:00 (1-minute gap).
 
     It assumes the schedule has already been pre-filtered for true overlaps.
+
+    Sections already carry per-day start/end minute bitmasks (built once in
+    Section.__init__), so instead of grouping and sorting timeslot lists per
+    call, the masks are OR-ed across the schedule and each day's count is a
+    single shift-AND-popcount. Two caveats of the mask representation:
+    zero-length placeholder slots are excluded when the masks are built
+    (their shared boundary bit would otherwise count against itself), and
+    identical boundary minutes from different classes collapse into one
+    bit, so a start adjacent to several coinciding ends is counted once.
     """
-    back_to_back_count = 0
-    daily_timeslots = {}
-    
-    # A tolerance of 1.5 minutes, converted to the float representation of hours.
-    # (1.5 / 60.0) = 0.025
-    MINIMUM_GAP_TOLERANCE = 1.5 / 60.0
-
-    # 1. Group all class times by the day of the week.
+    starts = [0] * 8
+    ends = [0] * 8
     for section in schedule:
-        for day, _, _, start_time, end_time in section.timeslots:
-            daily_timeslots.setdefault(day, []).append((start_time, end_time))
-
-    # 2. For each day, check for back-to-back instances.
-    for day, timeslots in daily_timeslots.items():
-        if len(timeslots) < 2:
-            continue
-
-        # 3. Sort the classes chronologically by their start time.
-        sorted_times = sorted(timeslots)
-        
-        # 4. Compare each class with the one immediately preceding it.
-        for i in range(1, len(sorted_times)):
-            previous_end_time = sorted_times[i-1][1]
-            current_start_time = sorted_times[i][0]
-            
-            # 5. Check if the gap is smaller than our defined tolerance.
-            if (current_start_time - previous_end_time) < MINIMUM_GAP_TOLERANCE:
-                back_to_back_count += 1
-                
-    return back_to_back_count
+        for day, smask, emask in section.b2b_bounds:
+            starts[day] |= smask
+            ends[day] |= emask
+    return sum(_b2b_count(s, e) for s, e in zip(starts, ends) if s)
 
 def count_days_used(schedule) -> int:
     return len({d for sec in schedule for d,*_ in sec.timeslots})
@@ -190,12 +462,31 @@ def score_schedule(schedule, no_before: bool, no_after: bool,
                    avoid_friday: bool, avoid_back_to_back: bool,
                    minimize_days: bool, before_cutoff: float,
                    after_cutoff: float) -> int:
+    # All enabled metrics are accumulated in one walk over the timeslots
+    # rather than one traversal per count_* helper (the helpers remain for
+    # callers that want a single metric).
     score = 0
-    if no_before: score += count_morning_classes(schedule, before_cutoff)
-    if no_after:  score += count_evening_classes(schedule, after_cutoff)
-    if avoid_friday: score += count_friday_classes(schedule)
-    if avoid_back_to_back: score += count_back_to_back(schedule)
-    if minimize_days: score += count_days_used(schedule)
+    days_seen = set()
+    b2b_starts = [0] * 8
+    b2b_ends = [0] * 8
+    for sec in schedule:
+        for day, _, _, start, _ in sec.timeslots:
+            if no_before and start < before_cutoff:
+                score += 1
+            if no_after and start > after_cutoff:
+                score += 1
+            if avoid_friday and day == 'F':
+                score += 1
+            if minimize_days:
+                days_seen.add(day)
+        if avoid_back_to_back:
+            for day, smask, emask in sec.b2b_bounds:
+                b2b_starts[day] |= smask
+                b2b_ends[day] |= emask
+    if minimize_days:
+        score += len(days_seen)
+    if avoid_back_to_back:
+        score += sum(_b2b_count(s, e) for s, e in zip(b2b_starts, b2b_ends) if s)
     return score
 
 def main():
@@ -236,7 +527,7 @@ def main():
 
     if st.session_state.page == 'dash':
         if st.sidebar.button('Logout'):
-            for k in ['username','password','sem','best_schedules','idx']:
+            for k in ['username','password','sem','best_schedules','solve_key','idx']:
                 st.session_state.pop(k, None)
             st.session_state.page = 'login'
             st.rerun()
@@ -265,14 +556,11 @@ def main():
                 run_scraper(st.session_state.username, st.session_state.password, st.session_state.sem, csv_file)
             st.success('Course data scraped.')
 
-        sessions = load_sessions(csv_file)
+        sessions, df = load_dashboard_data(csv_file, os.path.getmtime(csv_file))
         if not sessions:
             st.error('Failed to load data.')
             return
 
-        df = pd.DataFrame([s.model_dump() for s in sessions])
-        df['base_code'] = df['full_code'].apply(get_base_code)
-
         st.header('Course Dashboard')
         st.subheader(f"Term: {st.session_state.sem}")
         if st.button('Check Timing Changes'):
@@ -286,7 +574,7 @@ def main():
                 st.success('No changes')
 
         unique = df[['base_code','course_name']].drop_duplicates('base_code')
-        unique['label'] = unique.apply(lambda r: f"{r.base_code} — {r.course_name}", axis=1)
+        unique['label'] = unique['base_code'] + ' — ' + unique['course_name']
         picks = st.multiselect('Select Courses', unique['label'])
 
         if st.button('Generate'):
@@ -294,25 +582,20 @@ def main():
             if not codes:
                 st.warning('Pick courses')
             else:
-                cds = {}
-                for c in codes:
-                    sub = df[df['base_code']==c]
-                    secs = []
-                    for lec, grp in sub.groupby('full_code'):
-                        tsl = []
-                        for _, r in grp.iterrows():
-                            for d in r['days'].replace(',',''):
-                                s = parse_time(r['start_time'])
-                                e = parse_time(r['end_time'])
-                                tsl.append((d, r['start_time'], r['end_time'], s, e))
-                        if tsl:
-                            secs.append(Section(c, lec, tsl))
-                    cds[c] = secs
-                scheds = generate_schedules(cds)
-                if scheds:
-                    scores = [score_schedule(s, no_before, no_after, avoid_friday, avoid_b2b, minimize_days, before_cutoff, after_cutoff) for s in scheds]
-                    m = min(scores)
-                    st.session_state.best_schedules = [s for s, sc in zip(scheds, scores) if sc == m]
+                # Everything that feeds the search, including the CSV's
+                # mtime; a repeat click with the same inputs reuses the
+                # schedules already sitting in session state.
+                solve_key = (tuple(sorted(codes)), no_before, no_after,
+                             avoid_friday, avoid_b2b, minimize_days,
+                             before_cutoff, after_cutoff, os.path.getmtime(csv_file))
+                if st.session_state.get('solve_key') == solve_key:
+                    best = st.session_state.get('best_schedules')
+                else:
+                    cds = build_sections(df, codes)
+                    best, _ = find_best_schedules(cds, no_before, no_after, avoid_friday, avoid_b2b, minimize_days, before_cutoff, after_cutoff)
+                if best:
+                    st.session_state.best_schedules = best
+                    st.session_state.solve_key = solve_key
                     st.session_state.idx = 0
                 else:
                     st.warning('No possible schedules')
@@ -334,7 +617,7 @@ def main():
             
             st.subheader(f'Best Schedule {idx+1} of {total}')
             st.write('**Lectures:** ' + ', '.join(f"{sec.course_code}:{sec.section_id}" for sec in sched))
-            st.pyplot(plot_schedule(sched))
+            st.pyplot(plot_schedule(sched), clear_figure=True)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
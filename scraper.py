@@ -1,28 +1,209 @@
 from playwright.async_api import async_playwright
 import asyncio
 import csv
+import hashlib
+import json
 import os
 import re
+import shutil
+import threading
+import requests
+import lxml.html
+from lxml import etree
+import pandas as pd
+
+# Walks the course-offerings table in-browser and returns fully structured
+# course records — the course row's code/name/credits paired with the nested
+# session rows that follow it — so a page is scraped in one round-trip and
+# the Python side only consumes the result.
+EXTRACT_JS = """
+() => {
+    const mainTable = document.querySelector('.Portal_Group_Table');
+    if (!mainTable) return [];
+    // One querySelectorAll over every cell; rows are reassembled through a
+    // Map keyed by parent <tr>, which preserves document order.
+    const byRow = new Map();
+    for (const td of mainTable.querySelectorAll('td')) {
+        const tr = td.parentElement;
+        let row = byRow.get(tr);
+        if (!row) {
+            row = {texts: [], nested: td.closest('table') !== mainTable,
+                   headerRow: tr.sectionRowIndex === 0,
+                   wraps: !!tr.querySelector('table')};
+            byRow.set(tr, row);
+        }
+        row.texts.push(td.innerText.trim());
+    }
+    const out = [];
+    let current = null;
+    for (const [tr, row] of byRow) {
+        if (row.nested) {
+            if (current && !row.headerRow) current.sessions.push(row.texts);
+        } else if (row.wraps) {
+            // Row hosting a nested session table: neutral, keep the course.
+        } else if (row.texts.length >= 3) {
+            current = {code: row.texts[0], name: row.texts[1], credits: row.texts[2], sessions: []};
+            out.push(current);
+        } else {
+            current = null;
+        }
+    }
+    return out.filter(c => c.sessions.length);
+}
+"""
+
+# XPath expressions compiled once; evaluation amortizes across the hundreds
+# of rows a listing page carries.
+_ROWS_XP = etree.XPath('./tbody/tr | ./tr')
+_CELLS_XP = etree.XPath('./td')
+_NESTED_TABLES_XP = etree.XPath('.//table')
+_NESTED_ROWS_XP = etree.XPath('.//table//tr')
+
+def parse_listing_html(html: str) -> list[dict]:
+    """
+    Python-side equivalent of EXTRACT_JS for listing pages fetched over
+    HTTP: pairs each course row with the session rows of the nested table
+    that follows it and returns the same structured records.
+    """
+    tree = lxml.html.fromstring(html)
+    tables = tree.find_class('Portal_Group_Table')
+    if not tables:
+        return []
+    out = []
+    current = None
+    for tr in _ROWS_XP(tables[0]):
+        tds = _CELLS_XP(tr)
+        if not tds:
+            continue
+        if _NESTED_TABLES_XP(tr):
+            # Wrapper row hosting the session table; first nested row is the
+            # header.
+            if current is not None:
+                for nested in _NESTED_ROWS_XP(tr)[1:]:
+                    texts = [td.text_content().strip() for td in _CELLS_XP(nested)]
+                    if texts:
+                        current['sessions'].append(texts)
+            continue
+        if len(tds) >= 3:
+            current = {'code': tds[0].text_content().strip(), 'name': tds[1].text_content().strip(),
+                       'credits': tds[2].text_content().strip(), 'sessions': []}
+            out.append(current)
+        else:
+            current = None
+    return [c for c in out if c['sessions']]
+
+# Cross-run cache of parsed listing pages keyed by URL. The portal does not
+# emit ETags, so a content hash stands in for the conditional request: when a
+# page's HTML is byte-identical to the previous poll, its parsed records are
+# reused and the lxml pass is skipped.
+_PAGE_CACHE_PATH = os.path.expanduser('~/.cache/cud_scraper_pages.json')
+
+def _load_page_cache():
+    try:
+        with open(_PAGE_CACHE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_page_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(_PAGE_CACHE_PATH), exist_ok=True)
+        with open(_PAGE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+# A Playwright connection is tied to the loop that created it, so every
+# sync entry point (credential check, scrape, HTTP fallback) runs on this
+# one persistent loop — that is what lets the cached Chromium survive
+# from verify_credentials into the scrape that follows.
+_scraper_loop = None
+_loop_lock = threading.Lock()
+
+def run_sync(coro):
+    """Run a coroutine to completion on the persistent scraper loop."""
+    global _scraper_loop
+    with _loop_lock:
+        if _scraper_loop is None or _scraper_loop.is_closed():
+            _scraper_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_scraper_loop)
+        return _scraper_loop.run_until_complete(coro)
 
 class CUDScraper:
-    def __init__(self, username, password, semester, csv_filename="course_offerings.csv"):
+    # One Chromium shared by every scraper instance so chained verify +
+    # scrape work doesn't pay two launches; it stays cached until the
+    # process exits. The cache is dropped if a caller shows up on a loop
+    # other than the one it was launched from (run_sync keeps the normal
+    # entry points on a single loop, so that is the exception).
+    _shared_playwright = None
+    _shared_browser = None
+    _shared_loop = None
+    _browser_lock = None
+
+    def __init__(self, username, password, semester, csv_filename="course_offerings.csv", max_concurrency=4):
         self.username = username
         self.password = password
         self.semester = semester
         self.url = "https://cudportal.cud.ac.ae/student/login.asp"
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
         self.csv_filename = csv_filename
+        # Bounded pool of reusable tabs; opening one costs tens of
+        # milliseconds, so at most max_concurrency are ever created and
+        # idle ones are recycled instead of closed.
+        self.max_concurrency = max_concurrency
+        self._pages = asyncio.Queue()
+        self._pages_made = 0
+        # The portal's schema is fixed, so the extractor script is bound
+        # once here; every evaluate reuses the identical string and V8's
+        # compile cache hits across pagination.
+        self._extract_js = EXTRACT_JS
 
     async def start_browser(self, headless=True):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=headless)
-        self.page = await self.browser.new_page()
+        cls = CUDScraper
+        loop = asyncio.get_running_loop()
+        if cls._shared_loop is not loop:
+            cls._shared_playwright = None
+            cls._shared_browser = None
+            cls._shared_loop = loop
+            cls._browser_lock = asyncio.Lock()
+        async with cls._browser_lock:
+            if cls._shared_browser is None or not cls._shared_browser.is_connected():
+                cls._shared_playwright = await async_playwright().start()
+                cls._shared_browser = await cls._shared_playwright.chromium.launch(headless=headless)
+            self.playwright = cls._shared_playwright
+            self.browser = cls._shared_browser
+        # One explicit context per instance for isolation; any extra tab
+        # shares it (and the login cookies) instead of spawning its own
+        # context.
+        self.context = await self.browser.new_context()
+        # The portal pages are plain HTML tables; skip the bytes that only
+        # matter visually so navigation settles on the markup alone.
+        await self.context.route('**/*', self._route_filter)
+        self.page = await self._acquire_page()
+
+    @staticmethod
+    async def _route_filter(route):
+        request = route.request
+        if request.resource_type in ('image', 'stylesheet', 'font', 'media') or 'analytics' in request.url:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _acquire_page(self):
+        if self._pages.empty() and self._pages_made < self.max_concurrency:
+            self._pages_made += 1
+            return await self.context.new_page()
+        return await self._pages.get()
+
+    def _release_page(self, page):
+        self._pages.put_nowait(page)
 
     async def login(self):
         try:
-            await self.page.goto(self.url, timeout=60000)
+            await self.page.goto(self.url, timeout=60000, wait_until='domcontentloaded')
             await self.page.fill("#txtUsername", self.username)
             await self.page.fill("#txtPassword", self.password)
             await self.page.wait_for_selector("#idterm", timeout=30000)
@@ -79,9 +260,7 @@ class CUDScraper:
             finally:
                 await self.close_browser()
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(_check())
+            return run_sync(_check())
         except Exception as e:
             raise RuntimeError(f"An unexpected error occurred during verification: {e}")
 
@@ -92,63 +271,110 @@ class CUDScraper:
     async def apply_filters(self):
         pass
 
-    async def scrape_courses(self, filename=None):
+    @staticmethod
+    def _merge_entries(courses_dict, entries):
+        # Both extraction paths hand over already-trimmed strings, so no
+        # field needs another strip here. A course that repeats across page
+        # boundaries is deduplicated with a per-course set of session
+        # tuples; tuple hashing stays in C.
+        for entry in entries:
+            course = courses_dict.setdefault(entry["code"], {
+                "course_name": entry["name"], "credits": entry["credits"],
+                "sessions": [], "seen": set()})
+            for td in entry["sessions"]:
+                if len(td) < 9:
+                    continue
+                key = (td[1], td[2], td[3], td[5], td[6], td[7], td[8])
+                if key in course["seen"]:
+                    continue
+                course["seen"].add(key)
+                course["sessions"].append({
+                    "instructor": td[1], "room": td[2], "days": td[3],
+                    "start_time": td[5], "end_time": td[6],
+                    "max_enroll": td[7], "total_enroll": td[8]
+                })
+
+    async def _pagination_urls(self, total_pages):
+        # When the pager's numbered links carry real hrefs, the remaining
+        # pages can be fetched over HTTP with the session cookies and parsed
+        # in Python, skipping the render entirely. Script-driven postback
+        # links ('javascript:...') make this return None.
+        try:
+            links = await self.page.evaluate(
+                "() => Array.from(document.querySelectorAll('a'))"
+                ".filter(a => /^\\d+$/.test(a.textContent.trim()))"
+                ".map(a => [a.textContent.trim(), a.href])")
+        except Exception:
+            return None
+        urls = {int(n): href for n, href in links if href.startswith('http')}
+        if all(p in urls for p in range(2, total_pages + 1)):
+            return urls
+        return None
+
+    async def scrape_courses(self, filename=None, defer_write=False):
         if filename is None:
             filename = self.csv_filename
         courses_dict = {}
         total_pages = 1
         try:
-            info = await self.page.query_selector("text=Viewing Page")
-            if info:
-                txt = await info.inner_text()
-                m = re.search(r'Total Pages:\s*(\d+)', txt)
-                if m:
-                    total_pages = int(m.group(1))
+            txt = await self.page.locator("text=Viewing Page").first.inner_text(timeout=5000)
+            m = re.search(r'Total Pages:\s*(\d+)', txt)
+            if m:
+                total_pages = int(m.group(1))
         except Exception:
             total_pages = 1
-        
+
+        self._merge_entries(courses_dict, await self.page.evaluate(self._extract_js))
+        page_urls = await self._pagination_urls(total_pages) if total_pages > 1 else None
+        if page_urls:
+            # Fetch the remaining pages in parallel over the context's HTTP
+            # connection pool; merge in page order so the CSV stays stable.
+            # A non-OK status or a page that parses to no courses (error
+            # page, session-expiry redirect to the login form) fails the
+            # whole HTTP path — better to re-walk the pagination by clicks
+            # than to silently write a truncated CSV, which would also be
+            # copied over the timing-diff baseline. Failed pages are never
+            # cached.
+            sem = asyncio.Semaphore(self.max_concurrency)
+            page_cache = _load_page_cache()
+
+            async def fetch(url):
+                async with sem:
+                    resp = await self.page.context.request.get(url)
+                    if not resp.ok:
+                        raise RuntimeError(f"HTTP {resp.status} for {url}")
+                    text = await resp.text()
+                digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+                hit = page_cache.get(url)
+                if hit and hit.get('hash') == digest and hit.get('entries'):
+                    return hit['entries']
+                entries = parse_listing_html(text)
+                if not entries:
+                    raise RuntimeError(f"no course rows parsed from {url}")
+                page_cache[url] = {'hash': digest, 'entries': entries}
+                return entries
+
+            try:
+                fetched = await asyncio.gather(*(fetch(page_urls[n]) for n in range(2, total_pages + 1)))
+            except Exception as e:
+                print(f"HTTP pagination failed ({e}); falling back to page clicks.")
+            else:
+                _save_page_cache(page_cache)
+                for entries in fetched:
+                    self._merge_entries(courses_dict, entries)
+                total_pages = 1  # rendered pagination below is not needed
+
         page_num = 1
         while page_num <= total_pages:
-            rows = await self.page.query_selector_all(".Portal_Group_Table tbody tr")
-            i = 0
-            while i < len(rows):
-                main_row = rows[i]
-                cells = await main_row.query_selector_all("td")
-                if len(cells) < 3:
-                    i += 1
-                    continue
-                code = (await cells[0].inner_text()).strip()
-                name = (await cells[1].inner_text()).strip()
-                credits = (await cells[2].inner_text()).strip()
-                session_row = None
-                if i + 1 < len(rows):
-                    poss = rows[i + 1]
-                    if await poss.query_selector("table"):
-                        session_row = poss
-                        i += 2
-                    else:
-                        i += 1
-                else:
-                    i += 1
-                if not session_row:
-                    continue
-                for tr in (await session_row.query_selector_all("tr"))[1:]:
-                    td = await tr.query_selector_all("td")
-                    if len(td) < 9:
-                        continue
-                    instr = (await td[1].inner_text()).strip()
-                    room = (await td[2].inner_text()).strip()
-                    days = (await td[3].inner_text()).strip()
-                    start = (await td[5].inner_text()).strip()
-                    end = (await td[6].inner_text()).strip()
-                    max_e = (await td[7].inner_text()).strip()
-                    tot_e = (await td[8].inner_text()).strip()
-                    courses_dict.setdefault(code, {"course_name": name, "credits": credits, "sessions": []})["sessions"].append({
-                        "instructor": instr, "room": room, "days": days,
-                        "start_time": start, "end_time": end,
-                        "max_enroll": max_e, "total_enroll": tot_e
-                    })
+            if page_num > 1:
+                self._merge_entries(courses_dict, await self.page.evaluate(self._extract_js))
             if page_num < total_pages:
+                # Remember the first cell of the current table; waiting for
+                # it to change is what proves the click actually swapped
+                # pages, since the stale table also satisfies a bare
+                # presence check.
+                marker = await self.page.evaluate(
+                    "() => { const td = document.querySelector('.Portal_Group_Table td'); return td ? td.innerText : ''; }")
                 try:
                     await self.page.get_by_role("link", name=str(page_num + 1), exact=True).first.click()
                 except Exception:
@@ -158,88 +384,170 @@ class CUDScraper:
                         print(f"Could not find next page link or 'Next' button on page {page_num}. Stopping.")
                         break
                 try:
-                    await self.page.wait_for_selector(".Portal_Group_Table", timeout=10000)
+                    await self.page.wait_for_function(
+                        "prev => { const td = document.querySelector('.Portal_Group_Table td'); return !!td && td.innerText !== prev; }",
+                        arg=marker, timeout=10000)
                 except Exception:
                     print(f"Table did not load on page {page_num + 1}. Stopping.")
                     break
             
             page_num += 1
 
-        with open(filename, "w", newline='', encoding='utf-8') as f:
-            w = csv.writer(f)
-            w.writerow(["No.", "Course", "Course Name", "Credits", "Instructor", "Room", "Days", "Start Time", "End Time", "Max Enrollment", "Total Enrollment"])
-            cnt = 1
-            for code, info in courses_dict.items():
-                first = True
-                for s in info["sessions"]:
-                    if first:
-                        w.writerow([cnt, code, info["course_name"], info["credits"], s["instructor"], s["room"], s["days"], s["start_time"], s["end_time"], s["max_enroll"], s["total_enroll"]])
-                        first = False
-                    else:
-                        w.writerow(["", "", "", "", s["instructor"], s["room"], s["days"], s["start_time"], s["end_time"], s["max_enroll"], s["total_enroll"]])
-                cnt += 1
+        if defer_write:
+            return courses_dict
+        await asyncio.to_thread(self._write_csv, filename, courses_dict)
+
+    @staticmethod
+    def _write_csv(filename, courses_dict):
+        rows = [["No.", "Course", "Course Name", "Credits", "Instructor", "Room", "Days", "Start Time", "End Time", "Max Enrollment", "Total Enrollment"]]
+        for cnt, (code, info) in enumerate(courses_dict.items(), start=1):
+            head = [cnt, code, info["course_name"], info["credits"]]
+            blank = ["", "", "", ""]
+            for i, s in enumerate(info["sessions"]):
+                rows.append((head if i == 0 else blank) +
+                            [s["instructor"], s["room"], s["days"], s["start_time"], s["end_time"], s["max_enroll"], s["total_enroll"]])
+        with open(filename, "w", newline='', encoding='utf-8', buffering=1 << 20) as f:
+            csv.writer(f).writerows(rows)
 
     async def close_browser(self):
-        if self.browser and self.browser.is_connected():
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        alive = self.browser and self.browser.is_connected()
+        if self.page is not None:
+            self._release_page(self.page)
+            self.page = None
+        while not self._pages.empty():
+            page = self._pages.get_nowait()
+            if alive:
+                await page.close()
+        self._pages_made = 0
+        if self.context is not None and alive:
+            await self.context.close()
+        self.context = None
+        # Only this instance's pages and context are torn down; the shared
+        # Chromium stays cached on the class for the next caller on the
+        # persistent loop and lives until the process exits.
+        self.browser = None
+        self.playwright = None
+
+    def _scrape_http(self):
+        session = requests.Session()
+        login = session.post(self.url, data={
+            "txtUsername": self.username, "txtPassword": self.password,
+            "idterm": self.semester, "btnLogin": "Login"}, timeout=30)
+        login.raise_for_status()
+        if "Invalid authorization credentials" in login.text:
+            raise RuntimeError("Invalid credentials provided.")
+        tree = lxml.html.fromstring(login.text)
+        tree.make_links_absolute(login.url)
+        links = [a for a in tree.xpath('//a[@href]') if 'Course Offering' in a.text_content()]
+        if not links:
+            raise LookupError("Course Offering link not found on the index page.")
+        listing = session.get(links[0].get('href'), timeout=30)
+        listing.raise_for_status()
+        entries = parse_listing_html(listing.text)
+        if not entries:
+            raise LookupError("No course rows in the server-rendered listing.")
+        courses_dict = {}
+        self._merge_entries(courses_dict, entries)
+        tree = lxml.html.fromstring(listing.text)
+        tree.make_links_absolute(listing.url)
+        page_urls = {}
+        for a in tree.xpath('//a[@href]'):
+            label = a.text_content().strip()
+            if label.isdigit():
+                page_urls[int(label)] = a.get('href')
+        for page_num in sorted(page_urls):
+            if page_num == 1:
+                continue
+            resp = session.get(page_urls[page_num], timeout=30)
+            resp.raise_for_status()
+            entries = parse_listing_html(resp.text)
+            if not entries:
+                # Error page or expired session rendered with a 200; bail
+                # out to the browser path rather than truncate the CSV.
+                raise LookupError(f"No course rows on listing page {page_num}.")
+            self._merge_entries(courses_dict, entries)
+        self._write_csv(self.csv_filename, courses_dict)
+
+    def run_http(self, headless=True):
+        """
+        HTTP-only fast path: the portal renders the offerings table
+        server-side, so a cookie-authenticated requests.Session (one
+        keep-alive connection, no Chromium) can do the whole scrape. Bad
+        credentials are reported as usual; any other surprise — moved
+        link, script-driven login, empty table — falls back to the
+        browser-driven run().
+        """
+        try:
+            self._scrape_http()
+            return
+        except RuntimeError:
+            raise
+        except Exception as e:
+            print(f"HTTP scrape failed ({e}); falling back to browser scrape.")
+        run_sync(self.run(headless=headless))
 
     async def run(self, headless=True):
+        courses_dict = None
         try:
             await self.start_browser(headless=headless)
             await self.login()
             await self.navigate_to_courses()
             await self.apply_filters()
-            await self.scrape_courses()
+            courses_dict = await self.scrape_courses(defer_write=True)
         finally:
-            await self.close_browser()
+            # The CSV write runs in a worker thread alongside browser
+            # teardown instead of holding the event loop first.
+            teardown = [self.close_browser()]
+            if courses_dict is not None:
+                teardown.append(asyncio.to_thread(self._write_csv, self.csv_filename, courses_dict))
+            await asyncio.gather(*teardown)
+
+def _session_times(df):
+    # Attach each session row to its course (the Course cell is only filled
+    # on a course's first row), number sessions per course, and keep just the
+    # columns the comparison needs — built directly, without copying the
+    # remaining columns of the source frame.
+    # Fields are trimmed at extraction time and both files are written by
+    # scrape_courses, so the values can be compared as-is.
+    out = pd.DataFrame({
+        'Course': df['Course'].replace('', pd.NA).ffill(),
+        'Start Time': df['Start Time'],
+        'End Time': df['End Time'],
+    })
+    out = out[out['Course'].notna()]
+    out['session_idx'] = out.groupby('Course').cumcount()
+    return out[['Course', 'session_idx', 'Start Time', 'End Time']].reset_index(drop=True)
 
 def check_timing_changes(csv_filename="course_offerings.csv"):
     if not os.path.exists(csv_filename):
         return ["Current course data not found."]
-    with open(csv_filename, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        current_rows = list(reader)
+    current = pd.read_csv(csv_filename, dtype=str, na_filter=False)
     sem_backup_name = f"backup_{os.path.basename(csv_filename)}"
     if not os.path.exists(sem_backup_name):
-        with open(sem_backup_name, 'w', newline='', encoding='utf-8') as sb:
-            writer = csv.DictWriter(sb, fieldnames=current_rows[0].keys())
-            writer.writeheader()
-            writer.writerows(current_rows)
+        shutil.copyfile(csv_filename, sem_backup_name)
         return []
-    with open(sem_backup_name, newline='', encoding='utf-8') as bf:
-        backup_rows = list(csv.DictReader(bf))
-    def group_by_course(rows):
-        groups = {}
-        last_code = None
-        for row in rows:
-            code = row['Course'].strip() or last_code
-            if not code:
-                continue
-            groups.setdefault(code, []).append(row)
-            last_code = code
-        return groups
-    current_groups = group_by_course(current_rows)
-    backup_groups = group_by_course(backup_rows)
+    backup = pd.read_csv(sem_backup_name, dtype=str, na_filter=False)
+    current_times = _session_times(current)
+    backup_times = _session_times(backup)
+    # Most polls find nothing changed; a single frame-equality check in C
+    # answers that without paying for the merge below.
+    if current_times.equals(backup_times):
+        shutil.copyfile(csv_filename, sem_backup_name)
+        return []
+    merged = current_times.merge(
+        backup_times, on=['Course', 'session_idx'],
+        how='left', suffixes=('', '_bak'))
+    is_new = merged['Start Time_bak'].isna()
+    differs = ~is_new & ((merged['Start Time'] != merged['Start Time_bak']) |
+                         (merged['End Time'] != merged['End Time_bak']))
     changes = []
-    for code, cur_sessions in current_groups.items():
-        back_sessions = backup_groups.get(code, [])
-        for idx, cur in enumerate(cur_sessions):
-            cur_start = cur.get('Start Time', '').strip()
-            cur_end = cur.get('End Time', '').strip()
-            if idx < len(back_sessions):
-                back = back_sessions[idx]
-                back_start = back.get('Start Time', '').strip()
-                back_end = back.get('End Time', '').strip()
-                if cur_start != back_start or cur_end != back_end:
-                    changes.append(f"Course {code} session {idx + 1} changed: new {cur_start}-{cur_end}, was {back_start}-{back_end}")
-            else:
-                changes.append(f"Course {code} session {idx + 1} is new: {cur_start}-{cur_end}")
-    with open(sem_backup_name, 'w', newline='', encoding='utf-8') as sb:
-        writer = csv.DictWriter(sb, fieldnames=current_rows[0].keys())
-        writer.writeheader()
-        writer.writerows(current_rows)
+    for code, idx, cur_start, cur_end, bak_start, bak_end in \
+            merged[is_new | differs].itertuples(index=False, name=None):
+        if isinstance(bak_start, str):
+            changes.append(f"Course {code} session {idx + 1} changed: new {cur_start}-{cur_end}, was {bak_start}-{bak_end}")
+        else:
+            changes.append(f"Course {code} session {idx + 1} is new: {cur_start}-{cur_end}")
+    shutil.copyfile(csv_filename, sem_backup_name)
     return changes
 if __name__ == "__main__":
     pass
\ No newline at end of file